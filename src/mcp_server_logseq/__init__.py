@@ -1,16 +1,58 @@
-"""Logseq MCP server package."""
+"""Logseq MCP server package.
+
+The server module (FastMCP, pydantic, httpx, ...) is imported only when `main`
+actually starts serving, so importing a submodule such as
+`mcp_server_logseq.normalize`, or running `--help`, stays cheap. The
+package-level names `server`, `mcp`, `config`, `ConfigError`,
+`default_config_path` and `load_config` are still available; they load the
+server on first access.
+"""
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import importlib
 import os
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from . import server
-from .config import ConfigError, default_config_path, load_config
-from .server import config, mcp
+
+_LAZY_EXPORTS = ("server", "mcp", "config", "ConfigError", "default_config_path", "load_config")
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # import_module, not `from . import ...`: the latter probes this very hook.
+    server = importlib.import_module(f"{__name__}.server")
+    cfg = importlib.import_module(f"{__name__}.config")
+
+    # Same bindings as the eager imports used to make. `config` is the server's
+    # connection dict, which shadows the `config` submodule attribute as before.
+    globals().update(
+        server=server,
+        mcp=server.mcp,
+        config=server.config,
+        ConfigError=cfg.ConfigError,
+        default_config_path=cfg.default_config_path,
+        load_config=cfg.load_config,
+    )
+    return globals()[name]
+
+
+def _run_stdio() -> None:
+    """Serve over stdio; the Logseq client's pool is closed when the loop ends."""
+    import anyio
+
+    from . import server
+
+    async def run() -> None:
+        async with server.client_lifespan():
+            await server.mcp.run_stdio_async()
+
+    anyio.run(run)
 
 
 def _run_streamable_http(host: str, port: int, http_token: str | None) -> None:
@@ -19,6 +61,7 @@ def _run_streamable_http(host: str, port: int, http_token: str | None) -> None:
     from mcp.server.transport_security import TransportSecuritySettings
 
     from .auth import BearerAuthMiddleware
+    from .server import client_lifespan, mcp
 
     if not http_token:
         raise SystemExit(
@@ -39,6 +82,17 @@ def _run_streamable_http(host: str, port: int, http_token: str | None) -> None:
     app = mcp.streamable_http_app()
     app.add_middleware(BearerAuthMiddleware, token=http_token)
 
+    # Chain the client's lifespan onto the app's, so uvicorn's graceful
+    # shutdown (SIGTERM from `docker stop`, Ctrl-C) closes the Logseq pool.
+    session_lifespan = app.router.lifespan_context
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app_):
+        async with client_lifespan(), session_lifespan(app_):
+            yield
+
+    app.router.lifespan_context = lifespan
+
     uvicorn.run(app, host=host, port=port)
 
 
@@ -84,8 +138,11 @@ def main() -> None:
             "Logseq API token required: pass --api-key or set LOGSEQ_API_TOKEN"
         )
 
-    config["token"] = token
-    config["url"] = args.url or os.getenv("LOGSEQ_API_URL") or "http://localhost:12315"
+    from . import server
+    from .config import ConfigError, default_config_path, load_config
+
+    server.config["token"] = token
+    server.config["url"] = args.url or os.getenv("LOGSEQ_API_URL") or "http://localhost:12315"
 
     cfg_path = Path(os.getenv("LOGSEQ_MCP_CONFIG") or default_config_path())
     try:
@@ -97,7 +154,7 @@ def main() -> None:
     if args.transport == "streamable-http":
         _run_streamable_http(args.host, args.port, args.http_token)
     else:
-        mcp.run(transport="stdio")
+        _run_stdio()
 
 
 if __name__ == "__main__":
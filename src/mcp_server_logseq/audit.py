@@ -10,12 +10,19 @@ not fail the underlying operation.
 from __future__ import annotations
 
 import datetime
+from types import MappingProxyType
 from typing import Optional
 
 from .client import LogseqClient
 from .config import AppConfig
 
 
+# createPage options for today's journal (read-only; shared across calls).
+_JOURNAL_PAGE_OPTS = MappingProxyType(
+    {"journal": True, "redirect": False, "createFirstBlock": False}
+)
+
+
 def _ordinal(day: int) -> str:
     if 11 <= day % 100 <= 13:
         suffix = "th"
@@ -39,7 +46,7 @@ async def _today_journal_page(client: LogseqClient, today: datetime.date) -> str
     name = default_journal_title(today)
     await client.call(
         "logseq.Editor.createPage",
-        [name, {}, {"journal": True, "redirect": False, "createFirstBlock": False}],
+        [name, {}, _JOURNAL_PAGE_OPTS],
     )
     return name
 
@@ -22,15 +22,20 @@ class BearerAuthMiddleware:
 
     def __init__(self, app: ASGIApp, token: str) -> None:
         self.app = app
-        self._expected = f"Bearer {token}"
+        # ASGI headers arrive as raw bytes; encode the expected value once so
+        # each request is a plain bytes comparison (no per-request decode).
+        self._expected = f"Bearer {token}".encode("utf-8")
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
-        headers = dict(scope.get("headers") or [])
-        provided = headers.get(b"authorization", b"").decode("latin-1")
+        provided = b""
+        for name, value in scope.get("headers") or ():
+            if name == b"authorization":
+                provided = value
+                break
 
         # Constant-time comparison to avoid leaking the token via timing.
         if not hmac.compare_digest(provided, self._expected):
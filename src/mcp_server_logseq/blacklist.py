@@ -12,13 +12,19 @@ Pure functions over normalized blocks (see normalize.py).
 from __future__ import annotations
 
 import unicodedata
+from functools import lru_cache
 from typing import Any
 
 DEFAULT_PLACEHOLDER = "<excluded block>"
 
 
+@lru_cache(maxsize=1024)
 def canon_page_name(name: str) -> str:
-    """Match Logseq's page-name identity: NFC, lowercased, slashes trimmed."""
+    """Match Logseq's page-name identity: NFC, lowercased, slashes trimmed.
+
+    Cached: the blacklist checks every page ref/tag of every returned block, and
+    the same few page names recur across a graph.
+    """
     s = unicodedata.normalize("NFC", name or "").strip().lower()
     return s.strip("/")
 
@@ -40,8 +46,12 @@ class Blacklist:
         return any(c == p or c.startswith(p + "/") for p in self._pages)
 
     def _block_references_excluded(self, block: dict) -> bool:
-        refs = list(block.get("page_refs") or []) + list(block.get("tags") or [])
-        return any(self.is_page_excluded(r) for r in refs)
+        return any(
+            self.is_page_excluded(r)
+            for refs in (block.get("page_refs"), block.get("tags"))
+            if refs
+            for r in refs
+        )
 
     def redact_block(self, block: dict) -> dict:
         """Return a collapsed placeholder for a redacted block (subtree dropped)."""
@@ -60,15 +70,24 @@ class Blacklist:
         }
 
     def filter_blocks(self, blocks: list[dict]) -> list[dict]:
-        """Recursively redact blocks that reference blacklisted pages."""
+        """Recursively redact blocks that reference blacklisted pages.
+
+        Copy-on-write: the input is never mutated, and only blocks on the path to
+        a redaction are copied — a clean subtree is returned as the same objects.
+        """
         if not self.active:
             return blocks
         out: list[dict] = []
+        changed = False
         for b in blocks:
             if self._block_references_excluded(b):
                 out.append(self.redact_block(b))
-            else:
-                b = dict(b)
-                b["children"] = self.filter_blocks(b.get("children") or [])
-                out.append(b)
-        return out
+                changed = True
+                continue
+            children = b.get("children") or []
+            kept = self.filter_blocks(children)
+            if kept is not children:
+                b = {**b, "children": kept}
+                changed = True
+            out.append(b)
+        return out if changed else blocks
@@ -2,34 +2,110 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any, Optional
 
+import anyio
 import httpx
 
+try:  # optional (`fast` extra): several times faster JSON encode/decode
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    # Read-only option mappings (MappingProxyType) encode as plain objects.
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # Compact UTF-8 with NaN/Infinity rejected, as httpx's json= encodes.
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False,
+        default=_json_default,
+    ).encode("utf-8")
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    try:
+        return orjson.dumps(obj, default=_json_default)
+    except TypeError:
+        # orjson refuses ints beyond 64 bits; the stdlib encodes them, so defer
+        # to it and both backends accept the same values. (One difference
+        # remains: orjson writes NaN/Infinity as null, the stdlib rejects them.)
+        return _stdlib_dumps(obj)
+
+
+if orjson is not None:
+    _dumps = _orjson_dumps
+    _loads = orjson.loads
+else:  # pragma: no cover - depends on the environment
+    _dumps = _stdlib_dumps
+    _loads = json.loads
+
+
+# Option objects for frequent getBlock/getPage calls, built once. Shared, so
+# they are read-only views; they are only serialized into request bodies.
+NO_CHILDREN: Mapping[str, Any] = MappingProxyType({"includeChildren": False})
+WITH_CHILDREN: Mapping[str, Any] = MappingProxyType({"includeChildren": True})
+
 
 class LogseqError(Exception):
     """A Logseq API call failed."""
 
 
 class LogseqClient:
-    def __init__(self, url: str, token: str, timeout: float = 15.0) -> None:
+    def __init__(
+        self,
+        url: str,
+        token: str,
+        timeout: float = 15.0,
+        retries: int = 2,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
         self._url = (url or "http://localhost:12315").rstrip("/")
-        self._token = token
-        self._http = httpx.AsyncClient(timeout=timeout)
+        self._retries = max(0, retries)
+        # One pooled client per process: keep-alive connections and the auth
+        # headers are set up once here instead of on every call. `transport` is
+        # for tests; left as None, httpx keeps honoring HTTP(S)_PROXY/ALL_PROXY.
+        self._http = httpx.AsyncClient(
+            base_url=self._url,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+            },
+            timeout=timeout,
+            transport=transport,
+        )
 
     async def call(self, method: str, args: Optional[list[Any]] = None) -> Any:
-        """Invoke a `logseq.*` method; return the decoded JSON result."""
+        """Invoke a `logseq.*` method; return the decoded JSON result.
+
+        Connect failures (e.g. Logseq's API server restarting) are retried with a
+        short backoff; nothing reached Logseq, so this is safe even for writes.
+        HTTP error statuses are not retried — most API methods mutate the graph.
+        """
         try:
-            resp = await self._http.post(
-                f"{self._url}/api",
-                headers={
-                    "Authorization": f"Bearer {self._token}",
-                    "Content-Type": "application/json",
-                },
-                json={"method": method, "args": args or []},
-            )
-        except httpx.RequestError as exc:
-            raise LogseqError(f"network error calling {method}: {exc}") from exc
+            body = _dumps({"method": method, "args": args or []})
+        except (TypeError, ValueError) as exc:
+            raise LogseqError(f"cannot encode args for {method}: {exc}") from exc
+        attempt = 0
+        while True:
+            try:
+                resp = await self._http.post("/api", content=body)
+                break
+            except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+                if attempt >= self._retries:
+                    raise LogseqError(f"network error calling {method}: {exc}") from exc
+                await anyio.sleep(0.1 * 2**attempt)
+                attempt += 1
+            except httpx.RequestError as exc:
+                raise LogseqError(f"network error calling {method}: {exc}") from exc
 
         if resp.status_code == 401:
             raise LogseqError("invalid Logseq API token")
@@ -37,7 +113,39 @@ class LogseqClient:
             raise LogseqError(f"{method} failed ({resp.status_code}): {resp.text}")
         if not resp.content:
             return None
-        return resp.json()
+        try:
+            return _loads(resp.content)
+        except ValueError as exc:  # json/orjson decode errors both subclass it
+            raise LogseqError(f"{method} returned a non-JSON response") from exc
+
+    async def call_many(
+        self, calls: list[tuple[str, Optional[list[Any]]]], concurrency: int = 8
+    ) -> list[Any]:
+        """Run independent calls concurrently; results come back in call order.
+
+        The Logseq HTTP API has no batch route, so this fans the calls out over
+        the pooled connections (at most `concurrency` in flight) instead of
+        paying one round-trip after another. The first failure cancels the
+        calls still pending and is re-raised as-is.
+        """
+        results: list[Any] = [None] * len(calls)
+        errors: list[Exception] = []
+        limiter = anyio.CapacityLimiter(max(1, concurrency))
+
+        async def one(i: int, method: str, args: Optional[list[Any]]) -> None:
+            async with limiter:
+                try:
+                    results[i] = await self.call(method, args)
+                except Exception as exc:
+                    errors.append(exc)
+                    tg.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as tg:
+            for i, (method, args) in enumerate(calls):
+                tg.start_soon(one, i, method, args)
+        if errors:
+            raise errors[0]
+        return results
 
     async def aclose(self) -> None:
         await self._http.aclose()
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import contextlib
 import os
+import re
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
@@ -53,6 +54,34 @@ def _edn_dumps(value: Any) -> str:
         return edn_format.dumps(value)
 
 
+# Tool calls build Datalog text from scalars on every request (names, markers,
+# query inputs). Those have fixed EDN spellings, so emit them directly instead
+# of going through edn_format's generic dispatch and the stderr mute above.
+# Escaping mirrors edn_format's, so the output is identical.
+_EDN_STR_ESCAPE = re.compile(r'[\x00-\x1f\\"]')
+_EDN_STR_ESCAPES = {chr(c): f"\\u{c:04x}" for c in range(0x20)}
+_EDN_STR_ESCAPES.update({"\\": "\\\\", '"': '\\"', "\b": "\\b", "\f": "\\f",
+                         "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
+def _edn_str(text: str) -> str:
+    return '"' + _EDN_STR_ESCAPE.sub(lambda m: _EDN_STR_ESCAPES[m.group(0)], text) + '"'
+
+
+def _edn_literal(value: Any) -> str:
+    """EDN text for a runtime value; fast path for plain str/int/bool/None."""
+    kind = type(value)
+    if kind is str:
+        return _edn_str(value)
+    if kind is bool:
+        return "true" if value else "false"
+    if kind is int:
+        return str(value)
+    if value is None:
+        return "nil"
+    return _edn_dumps(value)
+
+
 class ConfigError(Exception):
     """Raised on any invalid configuration (bad TOML/EDN/structure)."""
 
@@ -121,9 +150,12 @@ class _RawConfig(_Section):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompiledQuery:
-    """A query ready to run: split into the parts datascriptQuery/DB.q expect."""
+    """A query ready to run: split into the parts datascriptQuery/DB.q expect.
+
+    Compiled once at startup and only read afterwards, hence frozen.
+    """
 
     name: str
     description: str
@@ -135,7 +167,7 @@ class CompiledQuery:
     resolve_block_refs: Optional[bool]
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     read: ReadCfg
     write: WriteCfg
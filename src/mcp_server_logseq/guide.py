@@ -7,6 +7,8 @@ get plausibly wrong). All facts below are verified against the live graph.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 GUIDE = """\
 # Logseq MCP — query & write guide
 
@@ -106,6 +108,11 @@ make a task is `create_task`, which enforces the structure:
 """
 
 
+@lru_cache(maxsize=8)
 def render_guide(agent_prefix: str) -> str:
-    """Fill the guide with the deployment's actual agent write-prefix."""
+    """Fill the guide with the deployment's actual agent write-prefix.
+
+    The prefix is fixed per deployment, so the ~5 KB format runs once, not on
+    every get_logseq_guide call.
+    """
     return GUIDE.format(prefix=agent_prefix or "byAgent")
@@ -134,7 +134,7 @@ def normalize_block(block: dict, *, _depth: int = 0) -> dict:
     page_refs, tags, block_refs = extract_refs(content)
     page_name, journal_day = _page_info(block)
 
-    children = _field(block, "children") or []
+    children = _field(block, "children") or ()
     norm_children = [
         normalize_block(c, _depth=_depth + 1)
         for c in children
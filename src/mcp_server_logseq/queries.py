@@ -11,34 +11,62 @@ import datetime
 from typing import Any, Optional
 
 from .client import LogseqClient
-from .config import CompiledQuery, _edn_dumps
+from .config import CompiledQuery, _edn_literal
 
 
 class QueryError(Exception):
     pass
 
 
+def _journal_day(d: datetime.date) -> int:
+    return int(d.strftime("%Y%m%d"))
+
+
+def _today_journal_day() -> int:
+    return _journal_day(datetime.date.today())
+
+
+def _now_iso() -> str:
+    return datetime.datetime.now().isoformat(timespec="seconds")
+
+
+def _today_minus(arg: str) -> int:
+    try:
+        n = int(arg)
+    except ValueError as exc:
+        raise QueryError(f"bad token '@today-minus:{arg}'") from exc
+    return _journal_day(datetime.date.today() - datetime.timedelta(days=n))
+
+
+# `@name` tokens, and `@name:arg` tokens keyed by their name part.
+_TOKENS = {
+    "@today-journal-day": _today_journal_day,
+    "@now-iso": _now_iso,
+}
+_ARG_TOKENS = {
+    "@today-minus": _today_minus,
+}
+
+
 def resolve_input_token(token: Any) -> Any:
     """Replace server-resolved `@...` tokens with concrete values."""
     if not isinstance(token, str) or not token.startswith("@"):
         return token
-    today = datetime.date.today()
-    if token == "@today-journal-day":
-        return int(today.strftime("%Y%m%d"))
-    if token.startswith("@today-minus:"):
-        try:
-            n = int(token.split(":", 1)[1])
-        except ValueError as exc:
-            raise QueryError(f"bad token {token!r}") from exc
-        return int((today - datetime.timedelta(days=n)).strftime("%Y%m%d"))
-    if token == "@now-iso":
-        return datetime.datetime.now().isoformat(timespec="seconds")
+    name, sep, arg = token.partition(":")
+    if sep:
+        handler = _ARG_TOKENS.get(name)
+        if handler is not None:
+            return handler(arg)
+    else:
+        simple = _TOKENS.get(name)
+        if simple is not None:
+            return simple()
     raise QueryError(f"unknown input token: {token}")
 
 
 def _encode_inputs(inputs: list[Any]) -> list[str]:
     """Resolve @tokens then EDN-encode each input for datascriptQuery."""
-    return [_edn_dumps(resolve_input_token(v)) for v in inputs]
+    return [_edn_literal(resolve_input_token(v)) for v in inputs]
 
 
 async def run_datascript(
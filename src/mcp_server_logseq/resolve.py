@@ -11,7 +11,7 @@ from __future__ import annotations
 from typing import Optional
 
 from .blacklist import Blacklist
-from .client import LogseqClient
+from .client import NO_CHILDREN, LogseqClient
 from .normalize import normalize_block
 
 
@@ -40,7 +40,7 @@ async def _resolve_node(
     if block.get("redacted"):
         return
 
-    for uuid in block.get("block_refs") or []:
+    for uuid in block.get("block_refs") or ():
         if depth <= 0 or uuid in visited:
             continue
         visited.add(uuid)
@@ -55,7 +55,7 @@ async def _resolve_node(
                 f"(({uuid}))", summary["text"]
             )
 
-    for child in block.get("children") or []:
+    for child in block.get("children") or ():
         await _resolve_node(client, child, depth, blacklist, visited)
 
 
@@ -66,7 +66,7 @@ async def _resolve_one(
     blacklist: Optional[Blacklist],
     visited: set[str],
 ) -> Optional[dict]:
-    raw = await client.call("logseq.Editor.getBlock", [uuid, {"includeChildren": False}])
+    raw = await client.call("logseq.Editor.getBlock", [uuid, NO_CHILDREN])
     if not isinstance(raw, dict):
         return None
     rn = normalize_block(raw)
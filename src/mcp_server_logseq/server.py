@@ -7,19 +7,22 @@ not exposed. See assets/logseq-mcp-design-v0.7.md.
 
 from __future__ import annotations
 
-from typing import Annotated, Any, Optional
+import contextlib
+import re
+from typing import Annotated, Any, AsyncIterator, Optional
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 
 from .blacklist import Blacklist, canon_page_name
-from .client import LogseqClient
+from .client import WITH_CHILDREN, LogseqClient
 from . import audit
 from . import filesearch as fs
 from . import queries as q
 from . import resolve as rsv
 from . import writes as w
-from .config import AppConfig, CompiledQuery
+from .config import AppConfig, CompiledQuery, _edn_literal
 from .guide import render_guide
 from .normalize import normalize_block
 
@@ -31,6 +34,7 @@ config: dict[str, Optional[str]] = {"url": "http://localhost:12315", "token": No
 app_config: Optional[AppConfig] = None
 
 _client: Optional[LogseqClient] = None
+_blacklist_cache: Optional[tuple[tuple[str, ...], Blacklist]] = None
 
 mcp = FastMCP("logseq")
 
@@ -42,6 +46,23 @@ def get_client() -> LogseqClient:
     return _client
 
 
+async def close_client() -> None:
+    """Close the shared HTTP connection pool (called once on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+@contextlib.asynccontextmanager
+async def client_lifespan() -> AsyncIterator[None]:
+    """Scope the shared Logseq client to a transport's lifetime."""
+    try:
+        yield
+    finally:
+        await close_client()
+
+
 def _cfg() -> AppConfig:
     if app_config is None:  # pragma: no cover - always set at startup
         raise RuntimeError("config not loaded")
@@ -49,7 +70,12 @@ def _cfg() -> AppConfig:
 
 
 def _blacklist() -> Blacklist:
-    return Blacklist(_cfg().blacklist.pages)
+    """The configured Blacklist, built once and reused across tool calls."""
+    global _blacklist_cache
+    pages = tuple(_cfg().blacklist.pages)
+    if _blacklist_cache is None or _blacklist_cache[0] != pages:
+        _blacklist_cache = (pages, Blacklist(list(pages)))
+    return _blacklist_cache[1]
 
 
 def _read_depth(override: Optional[int]) -> int:
@@ -74,33 +100,45 @@ async def _finalize(blocks: list[dict], depth: int) -> list[dict]:
 
 _PULL = "[* {:block/page [:block/name :block/journal-day :block/original-name]}]"
 
+# Fixed query scaffolding, built once; tools only splice in their clauses.
+_FIND_PULL = f"[:find (pull ?b {_PULL})"
+_FIND_PULL_WITH_RULES = f"{_FIND_PULL} :in $ %"
+_DESCENDANT_RULES = (
+    "[[(descendant ?b ?a) [?b :block/parent ?a]]"
+    " [(descendant ?b ?a) [?b :block/parent ?p] (descendant ?p ?a)]]"
+)
+_NOT_JOURNAL = " [?b :block/page ?pg] (not-join [?pg] [?pg :block/journal-day ?jd])"
+_DEFAULT_TASK_MARKERS = ("TODO", "DOING", "NOW", "LATER")
+
 
 def _flatten(blocks: list[dict]):
     for b in blocks:
         yield b
-        yield from _flatten(b.get("children") or [])
+        yield from _flatten(b.get("children") or ())
 
 
-async def _search_datascript(query: str, regex: bool, case_sensitive: bool, exclude_journals: bool) -> list[dict]:
-    import re as _re
+def _search_hit(block: dict, page: Optional[str]) -> dict:
+    """The compact result shape both search backends return."""
+    return {"uuid": block["uuid"], "page": page, "status": block["status"], "text": block["text"]}
 
-    from .config import _edn_dumps
 
+async def _search_datascript(query: str, regex: bool, case_sensitive: bool, exclude_journals: bool) -> list[dict]:
     # Logseq's datascript sandbox allows includes?/re-find/re-pattern but NOT
     # lower-case; case-insensitive uses a (?i) regex. No nested calls per clause.
     if case_sensitive and not regex:
-        match = f"[(clojure.string/includes? ?c {_edn_dumps(query)})]"
+        match = f"[(clojure.string/includes? ?c {_edn_literal(query)})]"
     else:
-        body = query if regex else _re.escape(query)
-        pat = _edn_dumps(("" if case_sensitive else "(?i)") + body)
+        body = query if regex else re.escape(query)
+        pat = _edn_literal(("" if case_sensitive else "(?i)") + body)
         match = f"[(re-pattern {pat}) ?re] [(re-find ?re ?c)]"
     clauses = f"[?b :block/content ?c] {match}"
     if exclude_journals:
-        clauses += " [?b :block/page ?pg] (not-join [?pg] [?pg :block/journal-day ?jd])"
-    dq = f"[:find (pull ?b {_PULL}) :where {clauses}]"
+        clauses += _NOT_JOURNAL
+    dq = f"{_FIND_PULL} :where {clauses}]"
     rows = await get_client().call("logseq.DB.datascriptQuery", [dq])
     blocks = [normalize_block(b) for b in q.flatten_pull_rows(rows or [])]
-    return await _finalize(blocks, 0)
+    blocks = await _finalize(blocks, 0)
+    return [_search_hit(b, b["page"]) for b in blocks if not b.get("redacted")]
 
 
 async def _resolve_journal_pages(days: list[int]) -> list[str]:
@@ -118,7 +156,11 @@ async def _resolve_journal_pages(days: list[int]) -> list[str]:
 async def _search_files(query: str, regex: bool, case_sensitive: bool, exclude_journals: bool, top_k: int = 50) -> list[dict]:
     files_path = _cfg().search.files_path
     bl = _blacklist()
-    candidate_files = fs.find_candidate_files(files_path, query, regex, case_sensitive)
+    # ripgrep is a blocking subprocess; run it off the event loop so other
+    # in-flight tool calls keep making progress.
+    candidate_files = await anyio.to_thread.run_sync(
+        fs.find_candidate_files, files_path, query, regex, case_sensitive
+    )
 
     pages: list[str] = []
     journal_days: list[int] = []
@@ -138,13 +180,15 @@ async def _search_files(query: str, regex: bool, case_sensitive: bool, exclude_j
     ordered = [p for p in pages if not (p in seen or seen.add(p))][:top_k]
 
     matcher = fs.build_matcher(query, regex, case_sensitive)
+    trees = await get_client().call_many(
+        [("logseq.Editor.getPageBlocksTree", [page]) for page in ordered]
+    )
     results: list[dict] = []
-    for page in ordered:
-        tree = await get_client().call("logseq.Editor.getPageBlocksTree", [page]) or []
-        blocks = await _finalize([normalize_block(b) for b in tree], 0)
+    for page, tree in zip(ordered, trees):
+        blocks = await _finalize([normalize_block(b) for b in tree or []], 0)
         for b in _flatten(blocks):
             if not b.get("redacted") and matcher(b.get("text") or ""):
-                results.append({"uuid": b["uuid"], "page": page, "status": b["status"], "text": b["text"]})
+                results.append(_search_hit(b, page))
     return results
 
 
@@ -158,16 +202,8 @@ async def search(
 ) -> dict:
     """Full-text search across block content in the graph."""
     use_files = bool(_cfg().search.files_path) and fs.ripgrep_path() is not None
-    if use_files:
-        blocks_or_results = await _search_files(query, regex, case_sensitive, exclude_journals)
-        results = blocks_or_results
-    else:
-        blocks = await _search_datascript(query, regex, case_sensitive, exclude_journals)
-        results = [
-            {"uuid": b["uuid"], "page": b["page"], "status": b["status"], "text": b["text"]}
-            for b in blocks
-            if not b.get("redacted")
-        ]
+    run = _search_files if use_files else _search_datascript
+    results = await run(query, regex, case_sensitive, exclude_journals)
     backend = "files" if use_files else "datascript"
     return {"backend": backend, "count": len(results), "results": results[: (limit or 50)]}
 
@@ -184,49 +220,44 @@ async def find_tasks(
     agent: Annotated[Optional[str], Field(description="With scope=agent, narrow to this agent (tasks referencing [[<prefix>/<agent>]])")] = None,
 ) -> dict:
     """Find task blocks by marker, tag, priority, page or agent-ownership scope."""
-    from .config import _edn_dumps
-
     if scope not in ("all", "agent", "human"):
         raise ValueError("scope must be 'all', 'agent' or 'human'")
 
-    mk = markers or ["TODO", "DOING", "NOW", "LATER"]
-    mset = "#{" + " ".join(_edn_dumps(m.upper()) for m in mk) + "}"
+    mk = markers or _DEFAULT_TASK_MARKERS
+    mset = "#{" + " ".join(_edn_literal(m.upper()) for m in mk) + "}"
     clauses = [f"[?b :block/marker ?m] [(contains? {mset} ?m)]"]
     rules = None
 
     if under_tag:
-        rules = (
-            "[[(descendant ?b ?a) [?b :block/parent ?a]]"
-            " [(descendant ?b ?a) [?b :block/parent ?p] (descendant ?p ?a)]]"
-        )
+        rules = _DESCENDANT_RULES
         clauses.append(
             f"[?a :block/refs ?rp] [?rp :block/name ?n] "
-            f"[(clojure.string/starts-with? ?n {_edn_dumps(under_tag.lower())})] (descendant ?b ?a)"
+            f"[(clojure.string/starts-with? ?n {_edn_literal(under_tag.lower())})] (descendant ?b ?a)"
         )
     if tag:
-        clauses.append(f"[?b :block/refs ?tp] [?tp :block/name {_edn_dumps(tag.lower())}]")
+        clauses.append(f"[?b :block/refs ?tp] [?tp :block/name {_edn_literal(tag.lower())}]")
     if page:
-        clauses.append(f"[?b :block/page ?pg] [?pg :block/name {_edn_dumps(page.lower())}]")
+        clauses.append(f"[?b :block/page ?pg] [?pg :block/name {_edn_literal(page.lower())}]")
     if priority:
-        clauses.append(f"[?b :block/priority {_edn_dumps(priority.upper())}]")
+        clauses.append(f"[?b :block/priority {_edn_literal(priority.upper())}]")
 
     if scope != "all":
         pre = canon_page_name(_cfg().write.agent_write_prefix)
         if scope == "agent" and agent:
-            target = _edn_dumps(f"{pre}/{canon_page_name(agent)}")
+            target = _edn_literal(f"{pre}/{canon_page_name(agent)}")
             clauses.append(f"[?b :block/refs ?arp] [?arp :block/name {target}]")
         elif scope == "agent":
             clauses.append(
                 f"[?b :block/refs ?arp] [?arp :block/name ?arn] "
-                f"[(clojure.string/starts-with? ?arn {_edn_dumps(pre + '/')})]"
+                f"[(clojure.string/starts-with? ?arn {_edn_literal(pre + '/')})]"
             )
         else:  # human — exclude agent-owned tasks
             clauses.append(
                 f"(not-join [?b] [?b :block/refs ?arp] [?arp :block/name ?arn] "
-                f"[(clojure.string/starts-with? ?arn {_edn_dumps(pre + '/')})])"
+                f"[(clojure.string/starts-with? ?arn {_edn_literal(pre + '/')})])"
             )
 
-    head = "[:find (pull ?b " + _PULL + ") :in $ %" if rules else "[:find (pull ?b " + _PULL + ")"
+    head = _FIND_PULL_WITH_RULES if rules else _FIND_PULL
     dq = f"{head} :where " + " ".join(clauses) + "]"
     args = [dq, rules] if rules else [dq]
     rows = await get_client().call("logseq.DB.datascriptQuery", args)
@@ -268,12 +299,10 @@ async def list_pages(
     Namespace children are separate pages, so read_page on a parent shows none of
     them; use this to discover them. Matches the full lowercased ``:block/name``.
     """
-    from .config import _edn_dumps
-
     pre = canon_page_name(prefix)
     where = ["[?p :block/name ?name]", "[?p :block/original-name ?orig]"]
     if pre:
-        where.append(f"[(clojure.string/starts-with? ?name {_edn_dumps(pre + '/')})]")
+        where.append(f"[(clojure.string/starts-with? ?name {_edn_literal(pre + '/')})]")
     dq = "[:find ?name ?orig :where " + " ".join(where) + "]"
     rows = await q.run_datascript(get_client(), dq)
     pages = _filter_page_rows(rows, pre, depth, _blacklist())
@@ -365,7 +394,7 @@ async def read_block(
     depth: Annotated[Optional[int], Field(description="Block-ref resolution depth (default from config)")] = None,
 ) -> dict:
     """Read a single block (and its children) with references resolved."""
-    raw = await get_client().call("logseq.Editor.getBlock", [uuid, {"includeChildren": True}])
+    raw = await get_client().call("logseq.Editor.getBlock", [uuid, WITH_CHILDREN])
     if not isinstance(raw, dict):
         raise ValueError(f"block {uuid!r} not found")
     blocks = await _finalize([normalize_block(raw)], _read_depth(depth))
@@ -394,11 +423,11 @@ async def write_note(
 async def create_task(
     title: Annotated[str, Field(description="Task text")],
     agent: Annotated[str, Field(description="Executor agent name, e.g. 'hermes' -> link [[<prefix>/hermes]]")],
-    project: Annotated[Optional[str], Field(description="Project page the task belongs to, e.g. 'Frisbee/Tech Support Bot'")] = None,
+    project: Annotated[Optional[str], Field(description="Project page the task belongs to, e.g. 'Frisbee/Tech Support Bot'; brackets in the name must be balanced")] = None,
     marker: Annotated[str, Field(description="Task marker (TODO/DOING/NOW/LATER/WAITING/...)")] = "TODO",
     priority: Annotated[Optional[str], Field(description="Priority A/B/C")] = None,
     tags: Annotated[Optional[list[str]], Field(description="Extra category tags, e.g. ['plan']")] = None,
-    plan_page: Annotated[Optional[str], Field(description="Detailed plan page, e.g. 'byAgent/hermes/proj/plan'")] = None,
+    plan_page: Annotated[Optional[str], Field(description="Detailed plan page, e.g. 'byAgent/hermes/proj/plan'; brackets in the name must be balanced")] = None,
     blocks_on: Annotated[Optional[str], Field(description="UUID of a blocking/parent task block -> ((uuid))")] = None,
     on_page: Annotated[Optional[str], Field(description="Agent-namespace page to hold the task (default <agent>/tasks)")] = None,
 ) -> dict:
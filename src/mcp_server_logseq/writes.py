@@ -7,10 +7,11 @@ only the leading marker.
 
 from __future__ import annotations
 
+from types import MappingProxyType
 from typing import Any, Optional
 
 from .blacklist import canon_page_name
-from .client import LogseqClient
+from .client import NO_CHILDREN, LogseqClient
 from .config import AppConfig
 from .normalize import normalize_block, parse_marker, rewrite_marker, MARKERS
 
@@ -19,6 +20,11 @@ class WriteError(Exception):
     pass
 
 
+# createPage options (read-only; shared across calls).
+_CREATE_PAGE_OPTS = MappingProxyType({"redirect": False, "createFirstBlock": False})
+_CREATE_PAGE_WITH_BLOCK_OPTS = MappingProxyType({"redirect": False, "createFirstBlock": True})
+
+
 def resolve_agent_path(config: AppConfig, subpath: str) -> str:
     """Map a caller subpath to a full page name, enforcing the agent namespace."""
     sub = (subpath or "").strip().strip("/")
@@ -37,7 +43,7 @@ def resolve_agent_path(config: AppConfig, subpath: str) -> str:
 
 
 async def _get_page(client: LogseqClient, name: str) -> Optional[dict]:
-    page = await client.call("logseq.Editor.getPage", [name, {"includeChildren": False}])
+    page = await client.call("logseq.Editor.getPage", [name, NO_CHILDREN])
     return page if isinstance(page, dict) else None
 
 
@@ -49,7 +55,11 @@ async def _ensure_page(
         return existing, True
     created = await client.call(
         "logseq.Editor.createPage",
-        [name, properties or {}, {"redirect": False, "createFirstBlock": create_first_block}],
+        [
+            name,
+            properties or {},
+            _CREATE_PAGE_WITH_BLOCK_OPTS if create_first_block else _CREATE_PAGE_OPTS,
+        ],
     )
     if not isinstance(created, dict):
         raise WriteError(f"could not create page {name!r}")
@@ -119,6 +129,56 @@ def _tag_token(tag: str) -> str:
     return f"#[[{t}]]" if " " in t else f"#{t}"
 
 
+def _unwrap(value: str, opener: str, closer: str) -> str:
+    """Drop one enclosing `[[...]]`/`((...))` pair, if present.
+
+    Unlike `str.strip('[]')`, brackets that belong to the name itself (e.g.
+    `Notes [draft]`) are left alone.
+    """
+    v = value.strip()
+    n = len(opener)
+    if len(v) >= 2 * n and v[:n] == opener and v[-n:] == closer:
+        return v[n:-n]
+    return v
+
+
+def _brackets_balanced(text: str) -> bool:
+    depth = 0
+    for ch in text:
+        if ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+            if depth < 0:
+                return False
+    return depth == 0
+
+
+def _page_link_target(value: str, what: str) -> str:
+    """Page name for a `[[...]]` link.
+
+    One enclosing `[[...]]` is dropped. What remains may contain brackets
+    (`[WIP] Project`, `Notes [draft]`) as long as every `[` is closed by a `]`;
+    unbalanced brackets or a nested `[[`/`]]` link are refused.
+    """
+    name = _unwrap(value, "[[", "]]")
+    if not name:
+        raise WriteError(f"{what} {value!r} has no page name")
+    if "[[" in name or "]]" in name:
+        raise WriteError(f"{what} {value!r} contains a nested [[ ]] link")
+    if not _brackets_balanced(name):
+        raise WriteError(f"{what} {value!r} has unbalanced [ ] brackets")
+    return name
+
+
+def _block_ref_target(value: str) -> str:
+    """UUID for a `((...))` ref; stray/unbalanced parens are refused."""
+    uuid = _unwrap(value, "((", "))")
+    if not uuid or "(" in uuid or ")" in uuid:
+        raise WriteError(f"blocks_on {value!r} has stray or unbalanced (( )) parens")
+    return uuid
+
+
 def build_task_content(
     *,
     title: str,
@@ -131,7 +191,7 @@ def build_task_content(
     plan_page: Optional[str],
     blocks_on: Optional[str],
 ) -> str:
-    """Assemble the canonical task block string (pure)."""
+    """Assemble the canonical task block string (pure; WriteError on bad links)."""
     parts = [marker]
     if priority:
         parts.append(f"[#{priority}]")
@@ -141,11 +201,11 @@ def build_task_content(
     parts.append(title.strip())
     parts.append(f"[[{agent_ref}]]")
     if project:
-        parts.append(f"[[{project.strip().strip('[]')}]]")
+        parts.append(f"[[{_page_link_target(project, 'project')}]]")
     if plan_page:
-        parts.append(f"[[{plan_page.strip().strip('[]')}]]")
+        parts.append(f"[[{_page_link_target(plan_page, 'plan_page')}]]")
     if blocks_on:
-        parts.append(f"(({blocks_on.strip('()')}))")
+        parts.append(f"(({_block_ref_target(blocks_on)}))")
     return " ".join(parts)
 
 
@@ -289,7 +349,7 @@ async def edit_block(
     if old_content == new_content:
         raise WriteError("old_content and new_content are identical (no change)")
 
-    raw = await client.call("logseq.Editor.getBlock", [uuid, {"includeChildren": False}])
+    raw = await client.call("logseq.Editor.getBlock", [uuid, NO_CHILDREN])
     if not isinstance(raw, dict):
         raise WriteError(f"block {uuid!r} not found")
 
@@ -321,7 +381,7 @@ async def set_task_status(
     if status not in MARKERS:
         raise WriteError(f"invalid status {status!r}; one of {', '.join(MARKERS)}")
 
-    raw = await client.call("logseq.Editor.getBlock", [uuid, {"includeChildren": False}])
+    raw = await client.call("logseq.Editor.getBlock", [uuid, NO_CHILDREN])
     if not isinstance(raw, dict):
         raise WriteError(f"block {uuid!r} not found")
     content = raw.get("content") or ""
@@ -0,0 +1,42 @@
+"""Tests for the bearer-token middleware guarding the HTTP transport.
+
+Drives the ASGI callable directly with a minimal scope; no server needed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from mcp_server_logseq.auth import BearerAuthMiddleware
+
+
+async def _ok_app(scope, receive, send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def _status(headers: list[tuple[bytes, bytes]]) -> tuple[int, dict]:
+    sent: list[dict] = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/mcp", "headers": headers}
+    asyncio.run(BearerAuthMiddleware(_ok_app, token="s3cret")(scope, receive, send))
+    start = sent[0]
+    return start["status"], dict(start["headers"])
+
+
+def test_accepts_matching_token() -> None:
+    status, _ = _status([(b"authorization", b"Bearer s3cret")])
+    assert status == 200
+
+
+def test_rejects_missing_or_wrong_token() -> None:
+    assert _status([])[0] == 401
+    status, headers = _status([(b"authorization", b"Bearer nope")])
+    assert status == 401
+    assert headers[b"www-authenticate"] == b"Bearer"
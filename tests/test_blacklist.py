@@ -43,3 +43,18 @@ def test_redacts_block_referencing_excluded_page() -> None:
     # second block redacted via tag, subtree collapsed
     assert out[1]["redacted"] is True
     assert out[1]["children"] == []
+
+
+def test_clean_tree_is_not_copied_and_input_not_mutated() -> None:
+    bl = Blacklist(["apikey"])
+    clean = [{"uuid": "a", "page_refs": ["public"], "tags": [], "children": [
+        {"uuid": "b", "page_refs": [], "tags": [], "children": []},
+    ]}]
+    assert bl.filter_blocks(clean) is clean
+
+    leaky = [{"uuid": "a", "page_refs": [], "tags": [], "children": [
+        {"uuid": "b", "page_refs": ["apikey"], "tags": [], "children": []},
+    ]}]
+    out = bl.filter_blocks(leaky)
+    assert out[0]["children"][0]["redacted"] is True
+    assert "redacted" not in leaky[0]["children"][0]  # original left intact
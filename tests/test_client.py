@@ -0,0 +1,251 @@
+"""Tests for LogseqClient (no live Logseq: a mock transport or stubbed `call`)."""
+
+from __future__ import annotations
+
+import asyncio
+import http.server
+import json
+import threading
+
+import httpx
+import pytest
+
+from mcp_server_logseq import client as client_mod
+from mcp_server_logseq.client import (
+    NO_CHILDREN,
+    LogseqClient,
+    LogseqError,
+    _dumps,
+    _stdlib_dumps,
+)
+
+
+class StubClient(LogseqClient):
+    """Records concurrency and echoes the args back instead of hitting HTTP."""
+
+    def __init__(self) -> None:
+        super().__init__("http://localhost:12315", "t")
+        self.in_flight = 0
+        self.peak = 0
+
+    async def call(self, method, args=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01 if args[0] % 2 else 0)  # finish out of order
+        self.in_flight -= 1
+        return (method, args[0])
+
+
+def test_call_many_keeps_order_and_bounds_concurrency() -> None:
+    client = StubClient()
+    calls = [("logseq.Editor.getPageBlocksTree", [i]) for i in range(10)]
+    res = asyncio.run(client.call_many(calls, concurrency=3))
+    assert res == [("logseq.Editor.getPageBlocksTree", i) for i in range(10)]
+    assert 1 < client.peak <= 3
+
+
+class FailingStubClient(LogseqClient):
+    """The first call fails fast; the others would finish later."""
+
+    def __init__(self) -> None:
+        super().__init__("http://localhost:12315", "t")
+        self.completed: list[int] = []
+
+    async def call(self, method, args=None):
+        if args[0] == 0:
+            raise LogseqError("boom")
+        await asyncio.sleep(0.05)
+        self.completed.append(args[0])
+        return args[0]
+
+
+def test_call_many_cancels_pending_calls_on_first_error() -> None:
+    client = FailingStubClient()
+    calls = [("logseq.Editor.getPageBlocksTree", [i]) for i in range(6)]
+    with pytest.raises(LogseqError, match="boom"):
+        asyncio.run(client.call_many(calls, concurrency=3))
+    assert client.completed == []
+
+
+def test_call_posts_json_with_auth_through_transport() -> None:
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"uuid": "u1"})
+
+    client = LogseqClient("http://localhost:12315/", "tok", transport=httpx.MockTransport(handler))
+    res = asyncio.run(client.call("logseq.Editor.getBlock", ["u1"]))
+    assert res == {"uuid": "u1"}
+    (req,) = seen
+    assert str(req.url) == "http://localhost:12315/api"
+    assert req.headers["authorization"] == "Bearer tok"
+    assert json.loads(req.content) == {"method": "logseq.Editor.getBlock", "args": ["u1"]}
+
+
+def _mock(handler) -> LogseqClient:
+    return LogseqClient("http://localhost:12315", "tok", transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.parametrize(
+    "response, match",
+    [
+        (httpx.Response(401), "invalid Logseq API token"),
+        (httpx.Response(500, text="boom"), r"failed \(500\): boom"),
+        (httpx.Response(200, text="<html>"), "non-JSON response"),
+    ],
+)
+def test_call_maps_failures_to_logseq_error(response, match) -> None:
+    client = _mock(lambda request: response)
+    with pytest.raises(LogseqError, match=match):
+        asyncio.run(client.call("logseq.App.getCurrentGraph"))
+
+
+def test_call_maps_network_error_to_logseq_error() -> None:
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        raise httpx.ConnectError("refused", request=request)
+
+    client = LogseqClient("http://localhost:12315", "tok", retries=1,
+                          transport=httpx.MockTransport(handler))
+    with pytest.raises(LogseqError, match="network error"):
+        asyncio.run(client.call("logseq.App.getCurrentGraph"))
+    assert len(attempts) == 2  # first try + one retry
+
+
+def test_call_retries_connect_failure_then_succeeds() -> None:
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        if len(attempts) < 3:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json={"ok": True})
+
+    assert asyncio.run(_mock(handler).call("logseq.App.getCurrentGraph")) == {"ok": True}
+    assert len(attempts) == 3
+
+
+def test_call_does_not_retry_read_errors_or_http_errors() -> None:
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        raise httpx.ReadError("reset", request=request)
+
+    with pytest.raises(LogseqError, match="network error"):
+        asyncio.run(_mock(handler).call("logseq.Editor.insertBlock"))
+    assert len(attempts) == 1  # the request may have reached Logseq
+
+
+def test_default_client_honors_env_proxies(monkeypatch) -> None:
+    # A tiny local "proxy": it records the absolute request URI and answers.
+    proxied: list[str] = []
+
+    class Proxy(http.server.BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            proxied.append(self.path)
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = b'{"via":"proxy"}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:
+            pass
+
+    proxy = http.server.HTTPServer(("127.0.0.1", 0), Proxy)
+    threading.Thread(target=proxy.serve_forever, daemon=True).start()
+    for var in ("NO_PROXY", "no_proxy", "ALL_PROXY", "all_proxy"):
+        monkeypatch.delenv(var, raising=False)
+    monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{proxy.server_port}")
+
+    async def run():
+        client = LogseqClient("http://logseq.invalid:12315", "tok")
+        try:
+            return await client.call("logseq.App.getCurrentGraph")
+        finally:
+            await client.aclose()
+
+    try:
+        assert asyncio.run(run()) == {"via": "proxy"}
+    finally:
+        proxy.shutdown()
+        proxy.server_close()
+    assert proxied == ["http://logseq.invalid:12315/api"]
+
+
+def test_empty_body_is_none() -> None:
+    assert asyncio.run(_mock(lambda request: httpx.Response(200)).call("m")) is None
+
+
+def test_body_is_sent_as_pre_encoded_bytes() -> None:
+    # content= hands our bytes straight to the transport: no second JSON encode.
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=None)
+
+    args = ["page", {"title": "Ünïcode \"quoted\""}]
+    asyncio.run(_mock(handler).call("logseq.Editor.createPage", args))
+    (req,) = seen
+    expected = _dumps({"method": "logseq.Editor.createPage", "args": args})
+    assert req.content == expected
+    assert req.headers["content-length"] == str(len(expected))
+    assert req.headers["content-type"] == "application/json"
+
+
+def test_stdlib_json_fallback(monkeypatch) -> None:
+    # Force the no-orjson path regardless of what this environment has installed.
+    monkeypatch.setattr(client_mod, "_dumps", _stdlib_dumps)
+    monkeypatch.setattr(client_mod, "_loads", json.loads)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, content='{"title":"Ünï"}'.encode("utf-8"))
+
+    args = ["page", {"n": 1, "t": "é"}]
+    assert asyncio.run(_mock(handler).call("logseq.Editor.getPage", args)) == {"title": "Ünï"}
+    assert seen[0].content == '{"method":"logseq.Editor.getPage","args":["page",{"n":1,"t":"é"}]}'.encode("utf-8")
+    with pytest.raises(ValueError):
+        _stdlib_dumps({"x": float("nan")})  # httpx json= rejects NaN too
+
+
+@pytest.mark.parametrize("backend", ["default", "stdlib"])
+def test_big_ints_encode_and_unencodable_args_raise_logseq_error(monkeypatch, backend) -> None:
+    if backend == "stdlib":
+        monkeypatch.setattr(client_mod, "_dumps", _stdlib_dumps)
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=None)
+
+    client = _mock(handler)
+    big = 2**70  # beyond orjson's 64-bit range
+    asyncio.run(client.call("logseq.Editor.upsertBlockProperty", ["u1", "n", big]))
+    assert json.loads(seen[0].content)["args"][2] == big
+    with pytest.raises(LogseqError, match="cannot encode args for logseq.Editor.createPage"):
+        asyncio.run(client.call("logseq.Editor.createPage", ["p", {"x": object()}]))
+    assert len(seen) == 1  # nothing sent for the unencodable call
+
+
+@pytest.mark.parametrize("backend", ["default", "stdlib"])
+def test_shared_option_constants_are_read_only_and_encode(monkeypatch, backend) -> None:
+    if backend == "stdlib":
+        monkeypatch.setattr(client_mod, "_dumps", _stdlib_dumps)
+    with pytest.raises(TypeError):
+        NO_CHILDREN["includeChildren"] = True  # type: ignore[index]
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=None)
+
+    asyncio.run(_mock(handler).call("logseq.Editor.getBlock", ["u1", NO_CHILDREN]))
+    assert json.loads(seen[0].content)["args"] == ["u1", {"includeChildren": False}]
@@ -6,7 +6,7 @@ from pathlib import Path
 
 import pytest
 
-from mcp_server_logseq.config import ConfigError, load_config
+from mcp_server_logseq.config import ConfigError, _edn_dumps, _edn_literal, load_config
 
 
 def _write(tmp_path: Path, name: str, text: str) -> Path:
@@ -202,3 +202,11 @@ def test_map_without_query_key_rejected(tmp_path: Path) -> None:
     p = _write(tmp_path, "config.toml", '[queries.bad]\nfile = "queries/bad.edn"\n')
     with pytest.raises(ConfigError):
         load_config(p)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["DONE", "", 'say "hi"', "back\\slash", "tab\tnl\nbell\x07", "(?i)ünï/côde", 20250603, -1, True, False, None, 1.5],
+)
+def test_edn_literal_matches_edn_format(value) -> None:
+    assert _edn_literal(value) == _edn_dumps(value)
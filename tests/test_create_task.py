@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import pytest
+
 from mcp_server_logseq.normalize import parse_marker
-from mcp_server_logseq.writes import build_task_content
+from mcp_server_logseq.writes import WriteError, build_task_content
 
 
 def _build(**kw):
@@ -43,3 +45,34 @@ def test_strips_stray_brackets_and_parens() -> None:
     out = _build(project="[[Proj]]", blocks_on="((abc))")
     assert "[[Proj]]" in out and "[[[[" not in out
     assert "((abc))" in out and "((((" not in out
+
+
+def test_keeps_brackets_that_belong_to_the_name() -> None:
+    out = _build(project="Notes [draft]", plan_page="[[Plan (v2)]]")
+    assert "[[Notes [draft]]]" in out
+    assert "[[Plan (v2)]]" in out
+
+
+def test_accepts_balanced_brackets_at_either_end() -> None:
+    out = _build(project="[WIP] Project", plan_page="[Proj]")
+    assert "[[[WIP] Project]]" in out
+    assert "[[[Proj]]]" in out
+
+
+@pytest.mark.parametrize(
+    "kw, match",
+    [
+        ({"project": "[[Proj]"}, "nested"),
+        ({"project": "Proj]]"}, "nested"),
+        ({"project": "[WIP Project"}, "unbalanced"),
+        ({"project": "Notes draft]"}, "unbalanced"),
+        ({"plan_page": "a ]b["}, "unbalanced"),
+        ({"plan_page": "[[]]"}, "no page name"),
+        ({"blocks_on": "((abc)"}, "stray or unbalanced"),
+        ({"blocks_on": "(abc)"}, "stray or unbalanced"),
+        ({"blocks_on": "abc))"}, "stray or unbalanced"),
+    ],
+)
+def test_rejects_stray_or_unbalanced_wrappers(kw, match) -> None:
+    with pytest.raises(WriteError, match=match):
+        _build(**kw)
@@ -0,0 +1,24 @@
+"""Tests for the package entry module: cheap import, lazy re-exports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+# Run in a fresh interpreter so sys.modules reflects only what the import loads.
+_CHECK = """
+import sys
+import mcp_server_logseq as pkg
+assert "mcp_server_logseq.server" not in sys.modules, "server imported eagerly"
+from mcp_server_logseq import ConfigError, config, default_config_path, load_config, mcp, server
+assert server is sys.modules["mcp_server_logseq.server"]
+assert mcp is server.mcp
+assert config is server.config and isinstance(config, dict)
+assert load_config is sys.modules["mcp_server_logseq.config"].load_config
+assert not hasattr(pkg, "no_such_name")
+"""
+
+
+def test_package_import_is_lazy_and_reexports_resolve() -> None:
+    proc = subprocess.run([sys.executable, "-c", _CHECK], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
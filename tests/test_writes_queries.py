@@ -7,7 +7,7 @@ import datetime
 import pytest
 
 from mcp_server_logseq.config import load_config
-from mcp_server_logseq.queries import _encode_inputs, resolve_input_token
+from mcp_server_logseq.queries import QueryError, _encode_inputs, resolve_input_token
 from mcp_server_logseq.writes import WriteError, resolve_agent_path
 
 
@@ -51,3 +51,12 @@ def test_resolve_input_token() -> None:
 def test_encode_inputs_edn() -> None:
     # strings get quoted (so Logseq's edn-read yields a string, not a symbol)
     assert _encode_inputs(["DONE", 5]) == ['"DONE"', "5"]
+
+
+def test_resolve_input_token_rejects_unknown_and_bad() -> None:
+    with pytest.raises(QueryError, match="unknown input token"):
+        resolve_input_token("@tomorrow")
+    with pytest.raises(QueryError, match="unknown input token"):
+        resolve_input_token("@now-iso:3")
+    with pytest.raises(QueryError, match="bad token"):
+        resolve_input_token("@today-minus:x")